@@ -11,72 +11,27 @@
 # FOR A PARTICULAR PURPOSE.
 #
 ##############################################################################
-"""Setup for zope.app.catalog package
+"""Setup for zope.componentvocabulary package
+
+All static metadata lives in pyproject.toml; only the dynamic
+long_description remains here.
 """
 import os
 
-from setuptools import find_packages
 from setuptools import setup
 
 
-def read(*rnames):
-    with open(os.path.join(os.path.dirname(__file__), *rnames)) as f:
-        return f.read()
+here = os.path.dirname(__file__)
+
 
+def read_many(*rnames):
+    parts = []
+    for rname in rnames:
+        with open(os.path.join(here, rname)) as f:
+            parts.append(f.read())
+    return '\n\n'.join(parts)
 
-TEST_REQUIRES = [
-    'zope.configuration',
-    'zope.testing',
-    'zope.testrunner',
-]
 
-setup(name='zope.componentvocabulary',
-      version='3.0.dev0',
-      author='Zope Foundation and Contributors',
-      author_email='zope-dev@zope.org',
-      description='Component vocabularies',
-      long_description=(
-          read('README.rst')
-          + '\n\n' +
-          read('CHANGES.rst')
-      ),
-      keywords="zope component architecture vocabulary",
-      classifiers=[
-          'Development Status :: 5 - Production/Stable',
-          'Environment :: Web Environment',
-          'Intended Audience :: Developers',
-          'License :: OSI Approved :: Zope Public License',
-          'Programming Language :: Python',
-          'Programming Language :: Python :: 3',
-          'Programming Language :: Python :: 3.7',
-          'Programming Language :: Python :: 3.8',
-          'Programming Language :: Python :: 3.9',
-          'Programming Language :: Python :: 3.10',
-          'Programming Language :: Python :: 3.11',
-          'Programming Language :: Python :: Implementation :: CPython',
-          'Programming Language :: Python :: Implementation :: PyPy',
-          'Natural Language :: English',
-          'Operating System :: OS Independent',
-          'Topic :: Internet :: WWW/HTTP',
-          'Framework :: Zope :: 3',
-      ],
-      url='http://github.com/zopefoundation/zope.componentvocabulary',
-      license='ZPL 2.1',
-      packages=find_packages('src'),
-      package_dir={'': 'src'},
-      namespace_packages=['zope'],
-      python_requires='>=3.7',
-      install_requires=[
-          'setuptools',
-          'zope.component',
-          'zope.i18nmessageid',
-          'zope.interface',
-          'zope.schema',
-          'zope.security',
-      ],
-      extras_require={
-          'test': TEST_REQUIRES,
-      },
-      include_package_data=True,
-      zip_safe=False,
-      )
+setup(
+    long_description=read_many('README.rst', 'CHANGES.rst'),
+)
@@ -17,6 +17,165 @@ __docformat__ = "reStructuredText"
 import doctest
 import unittest
 
+import zope.component
+from zope.interface import Interface
+from zope.interface import implementer
+
+
+class IStubUtility(Interface):
+    """A utility interface for the tests."""
+
+
+@implementer(IStubUtility)
+class StubUtility:
+    """A trivial utility."""
+
+
+class Unhashable:
+    """A value with equality but no hash."""
+
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __eq__(self, other):
+        return (isinstance(other, Unhashable)
+                and self.marker == other.marker)
+
+
+class TestUtilityVocabulary(unittest.TestCase):
+
+    def setUp(self):
+        from zope.component.testing import setUp
+        setUp()
+
+    def tearDown(self):
+        from zope.component.testing import tearDown
+        tearDown()
+
+    def _makeOne(self, utilities):
+        from zope.componentvocabulary.vocabulary import UtilityVocabulary
+        for name, util in utilities:
+            zope.component.provideUtility(util, IStubUtility, name)
+        return UtilityVocabulary(None, interface=IStubUtility)
+
+    def test_unhashable_utility_value_falls_back_to_scan(self):
+        util = Unhashable('a')
+        vocab = self._makeOne([('a', util)])
+        self.assertIsNone(vocab._by_value)
+        self.assertIn(util, vocab)
+        self.assertNotIn(Unhashable('b'), vocab)
+
+    def test_getTerm_with_unhashable_utility_value(self):
+        util = Unhashable('a')
+        vocab = self._makeOne([('a', util)])
+        self.assertEqual(vocab.getTerm(Unhashable('a')).token, 'a')
+        with self.assertRaises(LookupError):
+            vocab.getTerm(Unhashable('b'))
+
+    def test_unhashable_probe_against_hashable_terms(self):
+        vocab = self._makeOne([('a', StubUtility())])
+        self.assertIsNotNone(vocab._by_value)
+        self.assertNotIn(Unhashable('x'), vocab)
+        with self.assertRaises(LookupError):
+            vocab.getTerm(Unhashable('x'))
+
+    def test_subclass_with_class_level_configuration(self):
+        from zope.componentvocabulary.vocabulary import UtilityVocabulary
+
+        class StubVocabulary(UtilityVocabulary):
+            interface = IStubUtility
+
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'one')
+        vocab = StubVocabulary(None)
+        self.assertEqual([term.token for term in vocab], ['one'])
+
+
+class TestUtilityNames(unittest.TestCase):
+
+    def setUp(self):
+        from zope.component.testing import setUp
+        setUp()
+
+    def tearDown(self):
+        from zope.component.testing import tearDown
+        tearDown()
+
+    def _makeOne(self):
+        from zope.componentvocabulary.vocabulary import UtilityNames
+        return UtilityNames(IStubUtility)
+
+    def test_getTermByToken_undecodable_token(self):
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'one')
+        vocab = self._makeOne()
+        self.assertRaises(LookupError, vocab.getTermByToken, 't!!!!')
+        self.assertRaises(LookupError, vocab.getTermByToken, 't b25l')
+
+    def test_getTermByToken_unregistered_name(self):
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'one')
+        vocab = self._makeOne()
+        # 'tdHdv' decodes cleanly to 'two', which is not registered.
+        self.assertRaises(LookupError, vocab.getTermByToken, 'tdHdv')
+
+    def test_getTermByToken_non_canonical_token(self):
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'a')
+        vocab = self._makeOne()
+        self.assertEqual(vocab.getTermByToken('tYQ==').value, 'a')
+        # 'tYR==' also decodes to 'a' but is not the canonical token.
+        self.assertRaises(LookupError, vocab.getTermByToken, 'tYR==')
+
+    def test_len_is_cached_until_registration(self):
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'one')
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'two')
+        vocab = self._makeOne()
+        self.assertEqual(len(vocab), 2)
+        # The second call is served from the cache.
+        self.assertEqual(len(vocab), 2)
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'three')
+        self.assertEqual(len(vocab), 3)
+
+    def test_iter_primes_len_cache(self):
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'one')
+        vocab = self._makeOne()
+        self.assertEqual(len(list(vocab)), 1)
+        utilities = zope.component.getSiteManager().utilities
+        self.assertEqual(vocab._len_cache,
+                         (utilities, utilities._generation, 1))
+        self.assertEqual(len(vocab), 1)
+
+    def test_len_cache_not_shared_across_registries(self):
+        from zope.component import hooks
+        from zope.interface.registry import Components
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'one')
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'two')
+        vocab = self._makeOne()
+        self.assertEqual(len(vocab), 2)
+        sm = Components(
+            'test', bases=(zope.component.getGlobalSiteManager(),))
+        sm.registerUtility(StubUtility(), IStubUtility, 'three')
+
+        class Site:
+            def getSiteManager(self):
+                return sm
+
+        hooks.setHooks()
+        try:
+            hooks.setSite(Site())
+            self.assertEqual(len(vocab), 3)
+        finally:
+            hooks.setSite()
+            hooks.resetHooks()
+
+    def test_len_uncached_without_generation_counter(self):
+        zope.component.provideUtility(StubUtility(), IStubUtility, 'one')
+        vocab = self._makeOne()
+        # Simulate a utility registry without a _generation counter;
+        # counts must not be cached then.
+        vocab._registryState = lambda: (None, None)
+        self.assertEqual(len(vocab), 1)
+        self.assertFalse(hasattr(vocab, '_len_cache'))
+        self.assertEqual(len(list(vocab)), 1)
+        self.assertFalse(hasattr(vocab, '_len_cache'))
+
 
 class TestUtilityComponentInterfacesVocabulary(unittest.TestCase):
 
@@ -17,6 +17,7 @@ This vocabulary provides terms for all utilities providing a given interface.
 """
 __docformat__ = "reStructuredText"
 import base64
+import binascii
 
 import zope.component
 from zope.component.interface import interfaceToName
@@ -60,6 +61,8 @@ class UtilityTerm:
     <UtilityTerm zope.schema.interfaces.IVocabulary, instance of InterfaceClass>
     """  # noqa: E501 line too long
 
+    __slots__ = ('value', 'token')
+
     def __init__(self, value, token):
         """Create a term for value and token."""
         self.value = value
@@ -118,16 +121,17 @@ class UtilityVocabulary:
     >>> object4 in vocab
     False
 
-    We can also create a lazy iterator. Note that the utility terms might
-    appear in a different order than the utilities were registered.
+    We can also iterate over the vocabulary. The terms are ordered by
+    token (i.e. by utility name), so no caller-side sorting is needed.
 
-    >>> iterator = iter(vocab)
-    >>> terms = list(iterator)
-    >>> names = [term.token for term in terms]
-    >>> names.sort()
-    >>> names
+    >>> [term.token for term in vocab]
     ['object1', 'object2', 'object3']
 
+    The same pre-sorted terms are available as a tuple via ``terms()``:
+
+    >>> vocab.terms()[0]
+    <UtilityTerm object1, instance of Object>
+
     Determining the amount of utilities available via the vocabulary is also
     possible.
 
@@ -201,22 +205,75 @@ class UtilityVocabulary:
                 interface = zope.component.getUtility(IInterface, interface)
             self.interface = interface
 
-        utils = zope.component.getUtilitiesFor(self.interface, context)
-        self._terms = {
-            name: UtilityTerm(self.nameOnly and name or util, name)
-            for name, util in utils}
+        self._context = context
+
+    # The registry walk is deferred until a term is actually needed, so
+    # constructing a vocabulary that is never consulted stays cheap.  The
+    # terms never change once built, so membership tests, value lookups
+    # and iteration are served from structures computed on first use
+    # instead of scanning all terms on every call.
+
+    @property
+    def _terms(self):
+        try:
+            return self.__dict__['_terms']
+        except KeyError:
+            name_only = self.nameOnly
+            utils = zope.component.getUtilitiesFor(
+                self.interface, self._context)
+            terms = self.__dict__['_terms'] = {
+                name: UtilityTerm(name if name_only else util, name)
+                for name, util in utils}
+            return terms
+
+    @property
+    def _sorted_terms(self):
+        try:
+            return self.__dict__['_sorted_terms']
+        except KeyError:
+            sorted_terms = self.__dict__['_sorted_terms'] = tuple(
+                sorted(self._terms.values(), key=lambda term: term.token))
+            return sorted_terms
+
+    @property
+    def _by_value(self):
+        try:
+            return self.__dict__['_by_value']
+        except KeyError:
+            try:
+                by_value = {term.value: term
+                            for term in self._terms.values()}
+            except TypeError:
+                # At least one value is unhashable; fall back to
+                # linear scans.
+                by_value = None
+            self.__dict__['_by_value'] = by_value
+            return by_value
 
     def __contains__(self, value):
         """See zope.schema.interfaces.IBaseVocabulary"""
-        return value in (term.value for term in self._terms.values())
+        if self._by_value is not None:
+            try:
+                return value in self._by_value
+            except TypeError:
+                # The value itself is unhashable.
+                pass
+        return any(term.value == value for term in self._terms.values())
 
     def getTerm(self, value):
         """See zope.schema.interfaces.IBaseVocabulary"""
-        try:
-            return [term for name, term in self._terms.items()
-                    if term.value == value][0]
-        except IndexError:
-            raise LookupError(value)
+        if self._by_value is not None:
+            try:
+                return self._by_value[value]
+            except KeyError:
+                raise LookupError(value)
+            except TypeError:
+                # The value itself is unhashable.
+                pass
+        for term in self._terms.values():
+            if term.value == value:
+                return term
+        raise LookupError(value)
 
     def getTermByToken(self, token):
         """See zope.schema.interfaces.IVocabularyTokenized"""
@@ -225,11 +282,14 @@ class UtilityVocabulary:
         except KeyError:
             raise LookupError(token)
 
+    def terms(self):
+        """Return the tuple of all terms, ordered by token."""
+        return self._sorted_terms
+
     def __iter__(self):
         """See zope.schema.interfaces.IIterableVocabulary"""
-        # Sort the terms by the token (utility name)
-        values = sorted(self._terms.values(), key=lambda x: x.token)
-        return iter(values)
+        # The terms are pre-sorted by token (utility name).
+        return iter(self._sorted_terms)
 
     def __len__(self):
         """See zope.schema.interfaces.IIterableVocabulary"""
@@ -275,9 +335,8 @@ class ObjectInterfacesVocabulary(SimpleVocabulary):
         # Remove the security proxy so the values from the vocabulary
         # are the actual interfaces and not proxies.
         component = removeSecurityProxy(context)
-        interfaces = providedBy(component).flattened()
         terms = [SimpleTerm(interface, interfaceToName(context, interface))
-                 for interface in interfaces]
+                 for interface in providedBy(component).flattened()]
         super().__init__(terms)
 
 
@@ -326,22 +385,28 @@ class UtilityNameTerm:
 
     """
 
-    def __init__(self, value):
-        self.value = value.decode() if isinstance(value, bytes) else value
+    __slots__ = ('value', 'token')
 
-    @property
-    def token(self):
-        # Return our value as a token.  This is required to be 7-bit
-        # printable ascii. We'll use base64 generated from the UTF-8
-        # representation.  (The default encoding rules should not be
-        # allowed to apply.)
-        return "t" + base64.b64encode(self.value.encode('utf-8')).decode()
+    def __init__(self, value):
+        self.value = value
+        # Compute the token once; the value never changes.  The token is
+        # required to be 7-bit printable ascii, so we use base64 generated
+        # from the UTF-8 representation.  (The default encoding rules
+        # should not be allowed to apply.)  Going through binascii skips
+        # the Python-level wrapping in the base64 module.
+        self.token = "t" + binascii.b2a_base64(
+            self.value.encode('utf-8'), newline=False).decode('ascii')
 
     @property
     def title(self):
         return self.value or _("(unnamed utility)")
 
 
+# Terms are immutable, so the term for the unnamed utility can be
+# shared instead of constructed anew on every lookup.
+_EMPTY_UTILITY_NAME_TERM = UtilityNameTerm('')
+
+
 @implementer(IVocabularyTokenized)
 class UtilityNames:
     """Vocabulary with utility names for a single interface as values.
@@ -427,25 +492,59 @@ class UtilityNames:
 
     def getTerm(self, value):
         if value in self:
+            if not value:
+                return _EMPTY_UTILITY_NAME_TERM
             return UtilityNameTerm(value)
         raise ValueError(value)
 
     def getTermByToken(self, token):
-        for name, ut in zope.component.getUtilitiesFor(self.interface):
-            name = name.decode() if isinstance(name, bytes) else name
-            if token == "t":
-                if not name:
-                    break
-            elif UtilityNameTerm(name).token == token:
-                break
-        else:
-            raise LookupError("no matching token: %r" % token)
-        return self.getTerm(name)
+        # Tokens are "t" + base64(name); invert the encoding instead of
+        # enumerating every utility and encoding each of their names.
+        if token.startswith("t"):
+            try:
+                name = base64.b64decode(
+                    token[1:], validate=True).decode('utf-8')
+            except ValueError:
+                pass
+            else:
+                if name in self:
+                    term = (UtilityNameTerm(name) if name
+                            else _EMPTY_UTILITY_NAME_TERM)
+                    # Even with validation base64 accepts non-canonical
+                    # trailing bits ('tYR==' also decodes to 'a'), so
+                    # only the token the term itself produces resolves.
+                    if term.token == token:
+                        return term
+        raise LookupError("no matching token: %r" % token)
+
+    def _registryState(self):
+        # The utility registry bumps ``_generation`` on every
+        # (un)registration; together with the registry itself it
+        # identifies the snapshot a cached count belongs to.
+        utilities = getattr(zope.component.getSiteManager(),
+                            'utilities', None)
+        return utilities, getattr(utilities, '_generation', None)
 
     def __iter__(self):
+        # Count the names while yielding them, so a len() following a
+        # full iteration does not walk the registry a second time.
+        utilities, generation = self._registryState()
+        count = 0
         for name, ut in zope.component.getUtilitiesFor(self.interface):
+            count += 1
             yield UtilityNameTerm(name)
+        if generation is not None:
+            self._len_cache = (utilities, generation, count)
 
     def __len__(self):
         """Return the number of valid terms, or sys.maxint."""
-        return len(list(zope.component.getUtilitiesFor(self.interface)))
+        utilities, generation = self._registryState()
+        cached = getattr(self, '_len_cache', None)
+        if (cached is not None and generation is not None
+                and cached[0] is utilities and cached[1] == generation):
+            return cached[2]
+        count = sum(
+            1 for _ in zope.component.getUtilitiesFor(self.interface))
+        if generation is not None:
+            self._len_cache = (utilities, generation, count)
+        return count